@@ -3,6 +3,10 @@ import logging
 from scos_actions.actions.monitor_sigan import MonitorSignalAnalyzer
 from scos_actions.discover import init
 
+from scos_tekrsa.hardware.tekrsa_constants import (
+    RSA300_SERIES_MODELS,
+    RSA500_600_SERIES_MODELS,
+)
 from scos_tekrsa.settings import CONFIG_DIR, DEVICE_MODEL, SIGAN_CLASS, SIGAN_MODULE
 
 logger = logging.getLogger(__name__)
@@ -12,16 +16,9 @@ test_actions = {}
 logger.debug("scos-tekrsa: discovering actions")
 # Adjust ACTION_DEFINITIONS_DIR for specific Tektronix analyzer in use
 logger.debug(f"Device Model: {DEVICE_MODEL}")
-if DEVICE_MODEL in ["RSA306B", "RSA306"]:
+if DEVICE_MODEL in RSA300_SERIES_MODELS:
     ACTION_DEFINITIONS_DIR = CONFIG_DIR / "actions-300"
-elif DEVICE_MODEL in [
-    "RSA503A",
-    "RSA507A",
-    "RSA513A",
-    "RSA518A",
-    "RSA603A",
-    "RSA607A",
-]:
+elif DEVICE_MODEL in RSA500_600_SERIES_MODELS:
     ACTION_DEFINITIONS_DIR = CONFIG_DIR / "actions-500-600"
 else:
     logger.error(
@@ -101,12 +101,12 @@ class MockRSA:
         n_samp = int((dur_msec / 1000) * self.IQSTREAM_GetAcqParameters()[1])
 
         if self.randomize_values:
-            i = rng.normal(0.5, 0.5, n_samp)
-            q = rng.normal(0.5, 0.5, n_samp)
-            rand_iq = np.empty(n_samp, dtype=np.complex64)
-            rand_iq.real = i
-            rand_iq.imag = q
-            iq = rand_iq
+            # Draw interleaved float32 I/Q pairs, view them as complex64,
+            # then scale and offset in place so that I, Q ~ N(0.5, 0.5)
+            iq = rng.standard_normal(2 * n_samp, dtype=np.float32)
+            iq = iq.view(np.complex64)
+            iq *= np.float32(0.5)
+            iq += np.complex64(0.5 + 0.5j)
         else:
             iq = np.ones(n_samp, dtype=np.complex64)
         if return_status:
@@ -3,7 +3,7 @@ These are constants which are relevant for ALL supported Tektronix RSA devices.
 The values are obtained from the RSA API Programming Manual provided by Tektronix.
 """
 
-IQSTREAM_ALLOWED_SR = [  # Samples/sec
+IQSTREAM_ALLOWED_SR = (  # Samples/sec
     56.0e6,
     28.0e6,
     14.0e6,
@@ -17,9 +17,9 @@ IQSTREAM_ALLOWED_SR = [  # Samples/sec
     54687.5,
     24373.75,
     13671.875,
-]
+)
 
-IQSTREAM_ALLOWED_BW = [  # Hz
+IQSTREAM_ALLOWED_BW = (  # Hz
     40.0e6,
     20.0e6,
     10.0e6,
@@ -33,7 +33,7 @@ IQSTREAM_ALLOWED_BW = [  # Hz
     39062.5,
     19531.25,
     9765.625,
-]
+)
 
 IQSTREAM_SR_BW_MAP = dict(zip(IQSTREAM_ALLOWED_SR, IQSTREAM_ALLOWED_BW))
 IQSTREAM_BW_SR_MAP = dict(zip(IQSTREAM_ALLOWED_BW, IQSTREAM_ALLOWED_SR))
@@ -43,3 +43,9 @@ MIN_REFERENCE_LEVEL = -130  # dBm
 
 MAX_ATTENUATION = 51  # dB
 MIN_ATTENUATION = 0  # dB
+
+# Supported device models, grouped by series
+RSA300_SERIES_MODELS = frozenset(["RSA306", "RSA306B"])
+RSA500_600_SERIES_MODELS = frozenset(
+    ["RSA503A", "RSA507A", "RSA513A", "RSA518A", "RSA603A", "RSA607A"]
+)
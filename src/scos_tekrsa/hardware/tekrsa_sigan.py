@@ -10,7 +10,6 @@ import scos_tekrsa.hardware.tekrsa_constants as rsa_constants
 from scos_tekrsa import __package__ as SCOS_TEKRSA_NAME
 from scos_tekrsa import __version__ as SCOS_TEKRSA_VERSION
 from scos_tekrsa import settings
-from scos_tekrsa.hardware.mocks.rsa_block import MockRSA
 
 logger = logging.getLogger(__name__)
 
@@ -41,8 +40,9 @@ class TekRSASigan(SignalAnalyzerInterface):
             self.max_attenuation = rsa_constants.MAX_ATTENUATION  # dB
             self.min_attenuation = rsa_constants.MIN_ATTENUATION  # dB
 
-            # SR/BW mapping dict, with SR as keys and BW as values.
-            self.SR_BW_MAP = rsa_constants.IQSTREAM_SR_BW_MAP
+            # SR/BW mapping dicts, also used to validate requested values
+            self.SR_BW_MAP = rsa_constants.IQSTREAM_SR_BW_MAP  # SR keys, BW values
+            self.BW_SR_MAP = rsa_constants.IQSTREAM_BW_SR_MAP  # BW keys, SR values
 
             # These are device-dependent, set in get_constraints()
             self.max_frequency = None
@@ -82,6 +82,8 @@ class TekRSASigan(SignalAnalyzerInterface):
         if settings.RUNNING_TESTS or settings.MOCK_SIGAN:
             # Mock signal analyzer if desired
             logger.warning("Using mock Tektronix RSA signal analyzer.")
+            from scos_tekrsa.hardware.mocks.rsa_block import MockRSA
+
             random = settings.MOCK_SIGAN_RANDOM
             self.rsa = MockRSA(randomize_values=random)
         else:
@@ -149,21 +151,22 @@ class TekRSASigan(SignalAnalyzerInterface):
             err_msg = f"Sample rate {sample_rate} too high. Max sample rate is {self.max_sample_rate}."
             logger.error(err_msg)
             raise ValueError(err_msg)
-        if sample_rate not in self.ALLOWED_SR:
+        # Map sample rate to the IQ Bandwidth which determines it.
+        # This lookup also validates the requested sample rate.
+        bw = self.SR_BW_MAP.get(sample_rate)
+        if bw is None:
             # If requested sample rate is not an allowed value
             allowed_sample_rates_str = ", ".join(map(str, self.ALLOWED_SR))
             err_msg = (
                 f"Requested sample rate {sample_rate} not in allowed sample rates."
-                + f" Allowed sample rates are {allowed_sample_rates_str}"
+                f" Allowed sample rates are {allowed_sample_rates_str}"
             )
             logger.error(err_msg)
             raise ValueError(err_msg)
         # Set RSA IQ Bandwidth based on sample_rate
-        # The IQ Bandwidth determines the RSA sample rate.
-        bw = self.SR_BW_MAP.get(sample_rate)
         self.rsa.IQSTREAM_SetAcqBandwidth(bw)
         self._iq_bandwidth, self._sample_rate = self.rsa.IQSTREAM_GetAcqParameters()
-        msg = "Set Tektronix RSA sample rate: " + f"{self._sample_rate} samples/sec"
+        msg = f"Set Tektronix RSA sample rate: {self._sample_rate} samples/sec"
         logger.debug(msg)
 
     @property
@@ -174,11 +177,11 @@ class TekRSASigan(SignalAnalyzerInterface):
     @iq_bandwidth.setter
     def iq_bandwidth(self, iq_bandwidth):
         """Set the device sample rate and bandwidth by specifying the bandwidth."""
-        if iq_bandwidth not in self.ALLOWED_BW:
+        if iq_bandwidth not in self.BW_SR_MAP:
             allowed_bandwidths_str = ", ".join(map(str, self.ALLOWED_BW))
             err_msg = (
                 f"Requested IQ bandwidth {iq_bandwidth} not in allowed bandwidths."
-                + f" Allowed IQ bandwidths are {allowed_bandwidths_str}"
+                f" Allowed IQ bandwidths are {allowed_bandwidths_str}"
             )
             logger.error(err_msg)
             raise ValueError(err_msg)
@@ -186,9 +189,8 @@ class TekRSASigan(SignalAnalyzerInterface):
         self.rsa.IQSTREAM_SetAcqBandwidth(iq_bandwidth)
         self._iq_bandwidth, self._sample_rate = self.rsa.IQSTREAM_GetAcqParameters()
         msg = (
-            "Set Tektronix RSA IQ Bandwidth: "
-            + f"{self._iq_bandwidth} Hz, resulting in sample rate: "
-            + f"{self._sample_rate} samples/sec"
+            f"Set Tektronix RSA IQ Bandwidth: {self._iq_bandwidth} Hz,"
+            f" resulting in sample rate: {self._sample_rate} samples/sec"
         )
         logger.debug(msg)
 
@@ -220,7 +222,7 @@ class TekRSASigan(SignalAnalyzerInterface):
 
     @property
     def attenuation(self):
-        if self._model not in ["RSA306B", "RSA306"]:
+        if self._model not in rsa_constants.RSA300_SERIES_MODELS:
             # API returns attenuation as negative value. Convert to positive.
             self._attenuation = abs(self.rsa.CONFIG_GetRFAttenuator())
         else:
@@ -231,7 +233,7 @@ class TekRSASigan(SignalAnalyzerInterface):
     @attenuation.setter
     def attenuation(self, attenuation):
         """Set device attenuation, in dB, for RSA 500/600 series devices"""
-        if self._model not in ["RSA306B", "RSA306"]:
+        if self._model not in rsa_constants.RSA300_SERIES_MODELS:
             if self.min_attenuation <= abs(attenuation) <= self.max_attenuation:
                 self.rsa.CONFIG_SetAutoAttenuationEnable(False)
                 # API requires attenuation set as a negative number. Convert to negative.
@@ -243,14 +245,14 @@ class TekRSASigan(SignalAnalyzerInterface):
             else:
                 raise ValueError(
                     f"Attenuation setting must be between {self.min_attenuation}"
-                    + f" and {self.max_attenuation} dB."
+                    f" and {self.max_attenuation} dB."
                 )
         else:
             logger.debug("Tektronix RSA 300 series device has no attenuator.")
 
     @property
     def preamp_enable(self):
-        if self._model not in ["RSA306B", "RSA306"]:
+        if self._model not in rsa_constants.RSA300_SERIES_MODELS:
             self._preamp_enable = self.rsa.CONFIG_GetRFPreampEnable()
         else:
             logger.debug("Tektronix RSA 300 series device has no built-in preamp.")
@@ -259,9 +261,9 @@ class TekRSASigan(SignalAnalyzerInterface):
 
     @preamp_enable.setter
     def preamp_enable(self, preamp_enable):
-        if self._model not in ["RSA306B", "RSA306"]:
+        if self._model not in rsa_constants.RSA300_SERIES_MODELS:
             if self.preamp_enable != preamp_enable:
-                logger.debug("Switching preamp to " + str(preamp_enable))
+                logger.debug(f"Switching preamp to {preamp_enable}")
                 self.rsa.CONFIG_SetRFPreampEnable(preamp_enable)
                 self._preamp_enable = self.rsa.CONFIG_GetRFPreampEnable()
                 msg = f"Set Tektronix RSA preamp enable status: {self._preamp_enable}"
@@ -294,17 +296,19 @@ class TekRSASigan(SignalAnalyzerInterface):
                 raise ValueError("Requested number of samples must be an integer.")
             nskip = int(num_samples_skip)  # Requested number of samples to skip
             nsamps = nsamps_req + nskip  # Total number of samples to collect
+            # Query the sample rate once and reuse it for this acquisition
+            sample_rate = self.sample_rate
 
             # Determine correct time length (round up, integer ms)
-            durationMsec = int(1000 * (nsamps / self.sample_rate)) + (
-                1000 * nsamps % self.sample_rate > 0
+            durationMsec = int(1000 * (nsamps / sample_rate)) + (
+                1000 * nsamps % sample_rate > 0
             )
 
             if durationMsec == 0:
                 # Num. samples requested is less than minimum duration for IQ stream.
                 # Handle this by skipping more samples than requested
                 durationMsec = 1  # Minimum allowed IQ stream duration
-                nskip = int((self.sample_rate / 1000) - nsamps_req)
+                nskip = int((sample_rate / 1000) - nsamps_req)
                 nsamps = nskip + nsamps_req
 
             logger.debug(
@@ -333,7 +337,7 @@ class TekRSASigan(SignalAnalyzerInterface):
             elif (
                 not data_len == nsamps_req
             ):  # Invalid data: incorrect number of samples
-                msg = f"RSA error: requested {nsamps_req + nskip} samples, but got {data_len}."
+                msg = f"RSA error: requested {nsamps_req} samples, but got {data_len}."
                 logger.debug(msg)
                 raise RuntimeError(msg)
             else:
@@ -344,10 +348,10 @@ class TekRSASigan(SignalAnalyzerInterface):
                     "overload": self.overload,
                     "frequency": self.frequency,
                     "reference_level": self.reference_level,
-                    "sample_rate": self.rsa.IQSTREAM_GetAcqParameters()[1],
+                    "sample_rate": sample_rate,
                     "capture_time": self._capture_time,
                 }
-                if self._model not in ["RSA306B", "RSA306"]:
+                if self._model not in rsa_constants.RSA300_SERIES_MODELS:
                     measurement_result["attenuation"] = self.attenuation
                     measurement_result["preamp_enable"] = self.preamp_enable
                 return measurement_result
@@ -41,6 +41,7 @@ class TestTekRSA:
         assert self.rx.max_sample_rate == max(self.CORRECT_ALLOWED_SR)
         assert Counter(self.CORRECT_ALLOWED_BW) == Counter(self.rx.ALLOWED_BW)
         assert self.CORRECT_SR_BW_MAP == self.rx.SR_BW_MAP
+        assert rsa_constants.IQSTREAM_BW_SR_MAP == self.rx.BW_SR_MAP
         assert self.rx.max_reference_level == self.CORRECT_MAX_REFERENCE_LEVEL
         assert self.rx.min_reference_level == self.CORRECT_MIN_REFERENCE_LEVEL
         assert self.rx.max_attenuation == self.CORRECT_MAX_ATTENUATION